@@ -7,13 +7,39 @@ a float between 0.0 and 1.0.
 
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Iterable, Mapping, Optional, Sequence, Set
+from typing import FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+# Batches below this size are scored serially; forking work to the process
+# pool only pays off once the per-job scoring cost outweighs pickling.
+PARALLEL_MIN_JOBS = 500
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the shared scoring process pool, creating it lazily."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _pool
 
 
 WORD_RE = re.compile(r"[a-zA-Z0-9]+")
 
+# Maps every non-alphanumeric ASCII character to a space, so tokenization of
+# ASCII text becomes a single C-level translate + split instead of a regex scan.
+_TOKEN_TRANS = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if not c.isalnum()}
+)
+
 
 def _normalize(text: Optional[str]) -> str:
     """Return a normalized lowercase string or empty string if None."""
@@ -22,37 +48,159 @@ def _normalize(text: Optional[str]) -> str:
     return text.lower()
 
 
-def _tokenize(text: str) -> Set[str]:
-    """Split text into a set of lowercase tokens."""
-    return {match.group(0).lower() for match in WORD_RE.finditer(text or "")}
+def _tokenize(lowered: str) -> Set[str]:
+    """Split an already-lowercased text into a set of tokens.
+
+    Callers lowercase once up front (see `prepare_job`), so no per-token
+    `.lower()` is repeated here.
+    """
+    lowered = lowered or ""
+    if lowered.isascii():
+        return set(lowered.translate(_TOKEN_TRANS).split())
+    # Non-ASCII text keeps the regex path so token boundaries stay identical.
+    return set(WORD_RE.findall(lowered))
+
+
+@lru_cache(maxsize=2048)
+def _tokenize_title(title: str) -> FrozenSet[str]:
+    """Tokenize a job title, memoized because titles repeat across feeds.
+
+    Descriptions are deliberately not cached: they are long and rarely
+    identical, so caching them would only evict useful entries.
+    """
+    return frozenset(_tokenize(title))
+
+
+@dataclass(frozen=True)
+class PreparedProfile:
+    """
+    Profile data pre-normalized for scoring.
+
+    Building this once per request (instead of once per job) avoids
+    re-lowercasing the profile keyword lists for every job in a batch.
+    """
+
+    target_roles: FrozenSet[str]
+    skills: FrozenSet[str]
+    skill_bits: Optional[Mapping[str, int]]
+    bad_keywords: Tuple[str, ...]
+    bad_re: Optional["re.Pattern[str]"]
+    preferred_locations: Tuple[str, ...]
+    remote_only: bool
+    seniority_preference: Optional[str]
+    s_pref: int
+
+
+@dataclass(frozen=True)
+class PreparedJob:
+    """
+    Job fields pre-normalized for scoring.
+
+    Lowercasing and tokenization happen once here, so the individual score
+    components can share the results instead of re-deriving them.
+    """
+
+    title: str
+    description: str
+    location: str
+    text: str
+    published_at: Optional[datetime]
+    title_tokens: FrozenSet[str]
+    all_tokens: FrozenSet[str]
+
+
+def prepare_job(job: Mapping[str, object]) -> PreparedJob:
+    """
+    Normalize a job mapping into a `PreparedJob` ready for scoring.
+    """
+    title = _normalize(str(job.get("title") or ""))
+    description = _normalize(str(job.get("description") or ""))
+    location = _normalize(str(job.get("location") or ""))
+
+    title_tokens = _tokenize_title(title)
+
+    return PreparedJob(
+        title=title,
+        description=description,
+        location=location,
+        text=title + " " + description,
+        published_at=_parse_published_at(job.get("published_at")),
+        title_tokens=title_tokens,
+        all_tokens=title_tokens | _tokenize(description),
+    )
+
+
+def prepare_profile(profile: Mapping[str, object]) -> PreparedProfile:
+    """
+    Normalize a profile mapping into a `PreparedProfile` ready for scoring.
+    """
+    seniority_pref = profile.get("seniority_preference") or None
+    bad_keywords = tuple(k.lower() for k in (profile.get("bad_keywords") or []))
+    skills = frozenset(s.lower() for s in (profile.get("skills") or []))
+
+    return PreparedProfile(
+        target_roles=frozenset(r.lower() for r in (profile.get("target_roles") or [])),
+        skills=skills,
+        # With at most 64 skills each one gets a bit, so counting matches
+        # is an OR per token plus one popcount.
+        skill_bits=(
+            {s: 1 << i for i, s in enumerate(skills)} if 0 < len(skills) <= 64 else None
+        ),
+        bad_keywords=bad_keywords,
+        # One compiled alternation scans for every bad keyword in a single
+        # pass instead of one substring search per keyword.
+        bad_re=re.compile("|".join(map(re.escape, bad_keywords))) if bad_keywords else None,
+        preferred_locations=tuple(
+            p.lower() for p in (profile.get("preferred_locations") or []) if p
+        ),
+        remote_only=bool(profile.get("remote_only") or False),
+        seniority_preference=seniority_pref,
+        s_pref=_seniority_to_score(seniority_pref),
+    )
 
 
-def _contains_any(text: str, keywords: Iterable[str]) -> bool:
-    """Return True if any keyword appears in text (case-insensitive)."""
-    t = _normalize(text)
-    return any(k.lower() in t for k in keywords)
+# Seniority markers in priority order (the order the old if-cascade checked
+# them). The tuples are the single source of truth; the compiled alternation
+# below scans for all of them in one C-level pass.
+_SENIORITY_KEYWORDS = (
+    ("intern", ("intern", "trainee")),
+    ("junior", ("junior", " jr ", " jr.")),
+    ("lead", ("lead", "staff", "principal")),
+    ("senior", ("senior", " sr ", " sr.")),
+    ("mid", ("mid",)),
+)
+
+_SENIORITY_RE = re.compile(
+    "|".join(
+        "(?P<{}>{})".format(level, "|".join(map(re.escape, keywords)))
+        for level, keywords in _SENIORITY_KEYWORDS
+    )
+)
+
+_SENIORITY_PRIORITY = tuple(level for level, _ in _SENIORITY_KEYWORDS)
 
+# Seniority score indexed by |job level - preferred level|, clamped to 4.
+_SENIORITY_DIFF_SCORES = (1.0, 0.7, 0.4, 0.1, 0.1)
 
-def _count_keywords(tokens: Set[str], keywords: Iterable[str]) -> int:
-    """Count how many distinct keywords appear in the tokens set."""
-    lowered = {k.lower() for k in keywords}
-    return sum(1 for k in lowered if k in tokens)
+# Weights for the (title, skills, location, seniority, recency) features.
+SCORE_WEIGHTS = np.array([3.0, 3.0, 1.5, 1.0, 1.0])
+_WEIGHT_TOTAL = float(SCORE_WEIGHTS.sum())
 
 
+@lru_cache(maxsize=4096)
 def _parse_seniority_from_title(title: str) -> Optional[str]:
-    """Extract a simple seniority level from a job title if present."""
-    title_l = _normalize(title)
-
-    if "intern" in title_l or "trainee" in title_l:
-        return "intern"
-    if "junior" in title_l or " jr " in title_l or " jr." in title_l:
-        return "junior"
-    if "lead" in title_l or "staff" in title_l or "principal" in title_l:
-        return "lead"
-    if "senior" in title_l or " sr " in title_l or " sr." in title_l:
-        return "senior"
-    if "mid" in title_l or "middle" in title_l:
-        return "mid"
+    """Extract a simple seniority level from an already-lowercased job title.
+
+    Job feeds repeat titles constantly ("senior software engineer"), so the
+    parse result is memoized.
+    """
+    found = {match.lastgroup for match in _SENIORITY_RE.finditer(title or "")}
+    if not found:
+        return None
+
+    for level in _SENIORITY_PRIORITY:
+        if level in found:
+            return level
 
     return None
 
@@ -72,9 +220,8 @@ def _seniority_to_score(level: Optional[str]) -> int:
     return mapping.get(level, -1)
 
 
-def _location_score(job_location: str, preferred_locations: Sequence[str], remote_only: bool) -> float:
-    """Compute a location score between 0 and 1."""
-    loc = _normalize(job_location)
+def _location_score(loc: str, preferred_locations: Sequence[str], remote_only: bool) -> float:
+    """Compute a location score between 0 and 1 from lowercased inputs."""
     if not loc:
         return 0.2  # unknown location, small neutral score
 
@@ -85,7 +232,7 @@ def _location_score(job_location: str, preferred_locations: Sequence[str], remot
 
     if preferred_locations:
         for pref in preferred_locations:
-            if pref and pref.lower() in loc:
+            if pref and pref in loc:
                 return 1.0
 
         if remote_only and is_remote:
@@ -96,15 +243,40 @@ def _location_score(job_location: str, preferred_locations: Sequence[str], remot
     return 0.6 if is_remote else 0.4
 
 
-def _recency_score(published_at: Optional[datetime], max_days: int = 60) -> float:
-    """Compute a score between 0 and 1 based on how recent the job is."""
+def _parse_published_at(value: object) -> Optional[datetime]:
+    """Coerce a published_at value to a datetime, or None if unparseable."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return value if isinstance(value, datetime) else None
+
+
+def _seniority_score(title: str, prepared: PreparedProfile) -> float:
+    """Compute a seniority score between 0 and 1 from a lowercase title."""
+    if not prepared.seniority_preference:
+        return 0.5
+
+    s_job = _seniority_to_score(_parse_seniority_from_title(title))
+    s_pref = prepared.s_pref
+    if s_job == -1 or s_pref == -1:
+        return 0.5
+
+    return _SENIORITY_DIFF_SCORES[min(abs(s_job - s_pref), 4)]
+
+
+def _recency_score(published_at: Optional[datetime], now: datetime, max_days: int = 60) -> float:
+    """Compute a score between 0 and 1 based on how recent the job is.
+
+    `now` is passed in so batch callers read the clock once, not per job.
+    """
     if published_at is None:
         return 0.5
 
     if published_at.tzinfo is None:
         published_at = published_at.replace(tzinfo=timezone.utc)
 
-    now = datetime.now(timezone.utc)
     days = (now - published_at).days
 
     if days <= 0:
@@ -115,95 +287,165 @@ def _recency_score(published_at: Optional[datetime], max_days: int = 60) -> floa
     return max(0.0, 1.0 - (days / max_days))
 
 
-def compute_match_score(
-    job: Mapping[str, object],
-    profile: Mapping[str, object],
+def compute_match_score_prepared(
+    job: "Mapping[str, object] | PreparedJob",
+    prepared: PreparedProfile,
 ) -> float:
     """
-    Compute a match score between 0.0 and 1.0 for a job and a user profile.
+    Compute a match score between 0.0 and 1.0 for a job and a prepared profile.
 
     The score combines title, skills, location, seniority, and recency signals.
+    This is the batch-friendly entry point: the profile normalization cost is
+    paid once in `prepare_profile` instead of once per job.
     """
-    title = _normalize(str(job.get("title") or ""))
-    description = _normalize(str(job.get("description") or ""))
-    location = _normalize(str(job.get("location") or ""))
-
-    published_at = job.get("published_at")
-    if isinstance(published_at, str):
-        try:
-            published_at = datetime.fromisoformat(published_at)
-        except ValueError:
-            published_at = None
-
-    target_roles = profile.get("target_roles") or []
-    skills = profile.get("skills") or []
-    preferred_locations = profile.get("preferred_locations") or []
-    remote_only = bool(profile.get("remote_only") or False)
-    seniority_pref = profile.get("seniority_preference")
-    bad_keywords = profile.get("bad_keywords") or []
-
-    title_tokens = _tokenize(title)
-    desc_tokens = _tokenize(description)
-    all_tokens = title_tokens | desc_tokens
+    prepared_job = job if isinstance(job, PreparedJob) else prepare_job(job)
 
     # 1) Title score
-    if target_roles:
-        title_matches = _count_keywords(title_tokens, target_roles)
-        title_score = min(1.0, title_matches / max(1, len(target_roles)))
+    if prepared.target_roles:
+        title_matches = len(prepared_job.title_tokens & prepared.target_roles)
+        title_score = min(1.0, title_matches / len(prepared.target_roles))
     else:
         title_score = 0.5
 
     # 2) Skill score
-    if skills:
-        skill_matches = _count_keywords(all_tokens, skills)
-        skill_score = min(1.0, skill_matches / max(1, len(skills)))
+    if prepared.skills:
+        if prepared.skill_bits is not None:
+            mask = 0
+            skill_bits = prepared.skill_bits
+            for token in prepared_job.all_tokens:
+                mask |= skill_bits.get(token, 0)
+            skill_matches = mask.bit_count()
+        else:
+            skill_matches = len(prepared_job.all_tokens & prepared.skills)
+        skill_score = min(1.0, skill_matches / len(prepared.skills))
     else:
         skill_score = 0.5
 
     # 3) Location score
-    location_score = _location_score(location, preferred_locations, remote_only)
+    location_score = _location_score(
+        prepared_job.location, prepared.preferred_locations, prepared.remote_only
+    )
 
     # 4) Seniority score
-    seniority_job = _parse_seniority_from_title(title)
-    if seniority_pref:
-        s_job = _seniority_to_score(seniority_job)
-        s_pref = _seniority_to_score(seniority_pref)
-        if s_job == -1 or s_pref == -1:
-            seniority_score = 0.5
-        else:
-            diff = abs(s_job - s_pref)
-            if diff == 0:
-                seniority_score = 1.0
-            elif diff == 1:
-                seniority_score = 0.7
-            elif diff == 2:
-                seniority_score = 0.4
-            else:
-                seniority_score = 0.1
-    else:
-        seniority_score = 0.5
+    seniority_score = _seniority_score(prepared_job.title, prepared)
 
     # 5) Recency score
-    recency_score = _recency_score(published_at)
+    recency_score = _recency_score(prepared_job.published_at, datetime.now(timezone.utc))
 
     # Weighted combination
-    w_title = 3.0
-    w_skills = 3.0
-    w_location = 1.5
-    w_seniority = 1.0
-    w_recency = 1.0
-
-    weighted = (
-        w_title * title_score
-        + w_skills * skill_score
-        + w_location * location_score
-        + w_seniority * seniority_score
-        + w_recency * recency_score
+    features = np.array(
+        [title_score, skill_score, location_score, seniority_score, recency_score]
     )
-    base_score = weighted / (w_title + w_skills + w_location + w_seniority + w_recency)
+    base_score = float(features @ SCORE_WEIGHTS) / _WEIGHT_TOTAL
 
     # Bad keywords penalty
-    if bad_keywords and _contains_any(title + " " + description, bad_keywords):
+    if prepared.bad_re is not None and prepared.bad_re.search(prepared_job.text):
         base_score *= 0.3
 
     return float(round(max(0.0, min(1.0, base_score)), 4))
+
+
+def compute_match_scores_batch(
+    jobs: Sequence[Mapping[str, object]],
+    prepared: PreparedProfile,
+) -> List[float]:
+    """
+    Compute match scores for a batch of jobs against one prepared profile.
+
+    Title and skill matches are accumulated into boolean (jobs x keywords)
+    matrices so the score reductions run as bulk NumPy operations instead of
+    per-job Python arithmetic. Location, seniority, and recency stay per-job
+    since they depend on non-tokenizable fields.
+
+    Jobs are scored independently, so large batches are split across a
+    process pool; smaller ones stay serial to avoid pickling overhead.
+    """
+    n = len(jobs)
+    if n == 0:
+        return []
+
+    if n >= PARALLEL_MIN_JOBS:
+        pool = _get_pool()
+        workers = pool._max_workers or 1
+        chunk_size = -(-n // workers)  # ceil division
+        chunks = [jobs[i : i + chunk_size] for i in range(0, n, chunk_size)]
+        scores: List[float] = []
+        for result in pool.map(_score_chunk, chunks, [prepared] * len(chunks)):
+            scores.extend(result)
+        return scores
+
+    return _score_chunk(jobs, prepared)
+
+
+def _score_chunk(
+    jobs: Sequence[Mapping[str, object]],
+    prepared: PreparedProfile,
+) -> List[float]:
+    """Score one chunk of jobs serially (worker body for the process pool)."""
+    n = len(jobs)
+
+    roles = tuple(prepared.target_roles)
+    skills = tuple(prepared.skills)
+    role_idx = {r: i for i, r in enumerate(roles)}
+    skill_idx = {s: i for i, s in enumerate(skills)}
+
+    role_mask = np.zeros((n, len(roles)), dtype=bool) if roles else None
+    skill_mask = np.zeros((n, len(skills)), dtype=bool) if skills else None
+    location_score = np.empty(n)
+    seniority_score = np.empty(n)
+    recency_score = np.empty(n)
+    penalized = np.zeros(n, dtype=bool)
+
+    now = datetime.now(timezone.utc)
+
+    for i, job in enumerate(jobs):
+        prepared_job = job if isinstance(job, PreparedJob) else prepare_job(job)
+
+        if role_mask is not None:
+            for token in prepared_job.title_tokens & prepared.target_roles:
+                role_mask[i, role_idx[token]] = True
+        if skill_mask is not None:
+            for token in prepared_job.all_tokens & prepared.skills:
+                skill_mask[i, skill_idx[token]] = True
+
+        location_score[i] = _location_score(
+            prepared_job.location, prepared.preferred_locations, prepared.remote_only
+        )
+        seniority_score[i] = _seniority_score(prepared_job.title, prepared)
+        recency_score[i] = _recency_score(prepared_job.published_at, now)
+
+        if prepared.bad_re is not None and prepared.bad_re.search(prepared_job.text):
+            penalized[i] = True
+
+    if role_mask is not None:
+        title_score = np.minimum(1.0, role_mask.sum(axis=1) / len(roles))
+    else:
+        title_score = np.full(n, 0.5)
+
+    if skill_mask is not None:
+        skill_score = np.minimum(1.0, skill_mask.sum(axis=1) / len(skills))
+    else:
+        skill_score = np.full(n, 0.5)
+
+    features = np.stack(
+        [title_score, skill_score, location_score, seniority_score, recency_score]
+    )
+    base_score = (SCORE_WEIGHTS @ features) / _WEIGHT_TOTAL
+
+    base_score[penalized] *= 0.3
+    base_score = np.clip(base_score, 0.0, 1.0)
+
+    return [float(round(score, 4)) for score in base_score.tolist()]
+
+
+def compute_match_score(
+    job: Mapping[str, object],
+    profile: Mapping[str, object],
+) -> float:
+    """
+    Compute a match score between 0.0 and 1.0 for a job and a user profile.
+
+    Thin wrapper around `compute_match_score_prepared` kept for callers that
+    score a single job; batch callers should call `prepare_profile` once.
+    """
+    return compute_match_score_prepared(job, prepare_profile(profile))
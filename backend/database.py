@@ -12,7 +12,7 @@ caricate automaticamente da un file .env in locale.
 import os
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 # Carica le variabili dal file .env (solo in locale)
@@ -30,17 +30,52 @@ engine_kwargs = {}
 if DATABASE_URL.startswith("sqlite"):
     engine_kwargs["connect_args"] = {"check_same_thread": False}
 
+# Pooling per PostgreSQL: pre_ping scarta le connessioni morte (importante
+# con provider serverless tipo Neon), recycle evita i timeout lato server.
+# Le dimensioni sono configurabili via env senza toccare il codice.
+if DATABASE_URL.startswith("postgresql"):
+    engine_kwargs["pool_size"] = int(os.getenv("DB_POOL_SIZE", "20"))
+    engine_kwargs["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+    engine_kwargs["pool_pre_ping"] = True
+    engine_kwargs["pool_recycle"] = 1800
+
 # Crea l'engine
 engine = create_engine(
     DATABASE_URL,
     **engine_kwargs,
 )
 
+if DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        """
+        PRAGMA di performance per SQLite, applicati a ogni nuova connessione:
+        - WAL: i lettori non bloccano lo scrittore (e viceversa)
+        - synchronous=NORMAL: un solo fsync per commit invece di due
+        - cache_size=-65536: 64MB di page cache
+        - mmap_size: letture tramite memory-mapped I/O
+        - temp_store=MEMORY: tabelle temporanee e sort in RAM
+        """
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 # Base per i modelli ORM
 Base = declarative_base()
 
-# Factory per le sessioni DB
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Factory per le sessioni DB. expire_on_commit=False evita che ogni accesso
+# agli attributi dopo il commit generi una SELECT di ricaricamento.
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+)
 
 
 def get_db():
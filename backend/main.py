@@ -8,10 +8,16 @@ This file initializes the FastAPI application and exposes:
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime
 from typing import List, Optional
 
+import orjson
 from fastapi import Depends, FastAPI, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import and_, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from database import Base, engine, get_db
@@ -23,11 +29,18 @@ from models import (
     UserProfile as UserProfileORM,
     UserProfileRead,
     UserProfileUpdate,
+    generate_job_ids,
+)
+from app.services.scoring import (
+    PreparedProfile,
+    compute_match_scores_batch,
+    prepare_profile,
 )
-from app.services.scoring import compute_match_score
 
 
-app = FastAPI(title="Job Hunt Agent API")
+# orjson serializes responses (datetimes included) in C, which matters for
+# the job-listing endpoints that return large lists.
+app = FastAPI(title="Job Hunt Agent API", default_response_class=ORJSONResponse)
 
 
 # ---------------------------------------------------------------------------
@@ -48,6 +61,71 @@ def get_or_create_profile(db: Session) -> UserProfileORM:
     return profile
 
 
+# The profile table holds a single row that rarely changes but is read on
+# every ingest request, so the scoring-shaped dict is cached in process and
+# invalidated when the profile is updated.
+_profile_data_lock = threading.Lock()
+_profile_data_cache: Optional[dict] = None
+_prepared_profile_cache: Optional[PreparedProfile] = None
+
+
+def get_profile_data(db: Session) -> dict:
+    """
+    Return the profile as the dict shape the scoring engine expects,
+    served from the in-process cache when possible.
+    """
+    global _profile_data_cache
+
+    with _profile_data_lock:
+        if _profile_data_cache is not None:
+            return _profile_data_cache
+
+    profile = get_or_create_profile(db)
+    data = {
+        "full_name": profile.full_name,
+        "target_roles": profile.target_roles or [],
+        "skills": profile.skills or [],
+        "preferred_locations": profile.preferred_locations or [],
+        "bad_keywords": profile.bad_keywords or [],
+        "remote_only": bool(profile.remote_only),
+        "seniority_preference": profile.seniority_preference,
+    }
+
+    with _profile_data_lock:
+        _profile_data_cache = data
+
+    return data
+
+
+def get_prepared_profile(db: Session) -> PreparedProfile:
+    """
+    Return the cached PreparedProfile, rebuilding it only after a profile
+    update. The frozensets and compiled regex inside are therefore computed
+    once per profile change, not once per request.
+    """
+    global _prepared_profile_cache
+
+    with _profile_data_lock:
+        if _prepared_profile_cache is not None:
+            return _prepared_profile_cache
+
+    prepared = prepare_profile(get_profile_data(db))
+
+    with _profile_data_lock:
+        _prepared_profile_cache = prepared
+
+    return prepared
+
+
+def invalidate_profile_cache() -> None:
+    """Drop the cached profile data after a profile update."""
+    global _profile_data_cache, _prepared_profile_cache
+
+    with _profile_data_lock:
+        _profile_data_cache = None
+        _prepared_profile_cache = None
+
+
 # ---------------------------------------------------------------------------
 # Health check
 # ---------------------------------------------------------------------------
@@ -82,7 +160,7 @@ def update_profile(payload: UserProfileUpdate, db: Session = Depends(get_db)):
     Update the user profile stored in the database.
     """
     profile = get_or_create_profile(db)
-    data = payload.dict()
+    data = payload.model_dump()
 
     for key, value in data.items():
         if key == "remote_only":
@@ -94,6 +172,8 @@ def update_profile(payload: UserProfileUpdate, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(profile)
 
+    invalidate_profile_cache()
+
     return profile
 
 
@@ -102,84 +182,66 @@ def update_profile(payload: UserProfileUpdate, db: Session = Depends(get_db)):
 # ---------------------------------------------------------------------------
 
 
-@app.post("/jobs/test-ingest", response_model=JobRead)
-def ingest_test_job(job_data: JobCreate, db: Session = Depends(get_db)):
+def _ingest_jobs(db: Session, jobs: List[JobCreate]) -> List[dict]:
     """
-    Ingest a single test job, compute its score, and store it in the database.
-    """
-    profile = get_or_create_profile(db)
-
-    profile_data = {
-        "full_name": profile.full_name,
-        "target_roles": profile.target_roles or [],
-        "skills": profile.skills or [],
-        "preferred_locations": profile.preferred_locations or [],
-        "bad_keywords": profile.bad_keywords or [],
-        "remote_only": bool(profile.remote_only),
-        "seniority_preference": profile.seniority_preference,
-    }
+    Score and store a list of jobs, skipping duplicates based on
+    (source, source_id). Returns one response dict per input job, in order.
 
-    match_score = compute_match_score(job_data.dict(), profile_data)
-
-    new_job = Job(
-        title=job_data.title,
-        company=job_data.company,
-        location=job_data.location,
-        description=job_data.description,
-        url=job_data.url,
-        source=job_data.source,
-        source_id=job_data.source_id,
-        published_at=job_data.published_at,
-        match_score=match_score,
-    )
-
-    db.add(new_job)
-    db.commit()
-    db.refresh(new_job)
-
-    return JobRead.from_orm(new_job)
-
-
-@app.post("/jobs/ingest/batch", response_model=List[JobRead])
-def ingest_jobs_batch(payload: JobsBatchCreate, db: Session = Depends(get_db)):
+    Shared by both ingest endpoints so the bulk insert, dedup, and profile
+    caching apply to the single-job path as well.
     """
-    Ingest multiple jobs, compute their scores, and save them to the database,
-    skipping duplicates based on (source, source_id).
-    """
-    profile = get_or_create_profile(db)
+    prepared = get_prepared_profile(db)
+
+    # One query fetches every already-stored (source, source_id) pair, so the
+    # dedup check per incoming job is a dict lookup instead of a SELECT.
+    # source and source_id are required fields, so every job is keyed — an
+    # empty source_id dedups like any other value, matching the UNIQUE
+    # constraint the upsert relies on.
+    keys = {(jd.source, jd.source_id) for jd in jobs}
+    existing_by_key: dict = {}
+    if keys:
+        rows = db.query(Job).filter(tuple_(Job.source, Job.source_id).in_(keys)).all()
+        existing_by_key = {(j.source, j.source_id): j for j in rows}
+
+    stored_jobs: List[Optional[Job]] = []
+    new_jobs: List[JobCreate] = []
+    new_positions: List[int] = []
+    pending_by_key: dict = {}
+    duplicate_positions: List[tuple] = []
+
+    for job_data in jobs:
+        key = (job_data.source, job_data.source_id)
+
+        existing = existing_by_key.get(key)
+        if existing is not None:
+            stored_jobs.append(existing)
+            continue
 
-    profile_data = {
-        "full_name": profile.full_name,
-        "target_roles": profile.target_roles or [],
-        "skills": profile.skills or [],
-        "preferred_locations": profile.preferred_locations or [],
-        "bad_keywords": profile.bad_keywords or [],
-        "remote_only": bool(profile.remote_only),
-        "seniority_preference": profile.seniority_preference,
-    }
+        # Duplicate within this payload: reuse the first occurrence.
+        if key in pending_by_key:
+            duplicate_positions.append((len(stored_jobs), pending_by_key[key]))
+            stored_jobs.append(None)
+            continue
 
-    stored_jobs: List[Job] = []
+        pending_by_key[key] = len(new_jobs)
 
-    for job_data in payload.jobs:
-        existing: Optional[Job] = None
+        new_positions.append(len(stored_jobs))
+        stored_jobs.append(None)
+        new_jobs.append(job_data)
 
-        if job_data.source_id:
-            existing = (
-                db.query(Job)
-                .filter(
-                    Job.source == job_data.source,
-                    Job.source_id == job_data.source_id,
-                )
-                .first()
-            )
+    scores = compute_match_scores_batch([jd.model_dump() for jd in new_jobs], prepared)
 
-        if existing is not None:
-            stored_jobs.append(existing)
-            continue
+    # Time-ordered ids from one urandom read for the whole batch.
+    job_ids = generate_job_ids(len(new_jobs))
 
-        match_score = compute_match_score(job_data.dict(), profile_data)
+    created_jobs: List[Job] = []
+    now = datetime.utcnow()
 
+    for position, job_data, match_score, job_id in zip(
+        new_positions, new_jobs, scores, job_ids
+    ):
         new_job = Job(
+            id=job_id,
             title=job_data.title,
             company=job_data.company,
             location=job_data.location,
@@ -189,16 +251,71 @@ def ingest_jobs_batch(payload: JobsBatchCreate, db: Session = Depends(get_db)):
             source_id=job_data.source_id,
             published_at=job_data.published_at,
             match_score=match_score,
+            # Set Python-side defaults here so the rows are complete in
+            # memory and nothing needs to be re-read after the commit.
+            created_at=now,
+            updated_at=now,
         )
 
-        db.add(new_job)
-        stored_jobs.append(new_job)
+        stored_jobs[position] = new_job
+        created_jobs.append(new_job)
+
+    for position, new_index in duplicate_positions:
+        stored_jobs[position] = created_jobs[new_index]
+
+    # One bulk INSERT inside a single transaction instead of per-row adds:
+    # SQLite pays the commit fsync once for the whole batch. ON CONFLICT DO
+    # NOTHING lets the unique (source, source_id) constraint swallow rows a
+    # concurrent ingest stored after our dedup snapshot was taken.
+    if created_jobs:
+        insert_fn = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+        stmt = insert_fn(Job.__table__).on_conflict_do_nothing(
+            index_elements=["source", "source_id"]
+        )
+        rows = [
+            {column.name: getattr(job, column.name) for column in Job.__table__.columns}
+            for job in created_jobs
+        ]
+        db.execute(stmt, rows)
+
+    # Every field is already known in memory, so the response is built before
+    # the commit expires the pre-existing rows; nothing is re-read from the
+    # database afterwards.
+    response_items = [_job_to_response(job) for job in stored_jobs]
 
     db.commit()
-    for job in stored_jobs:
-        db.refresh(job)
 
-    return [JobRead.from_orm(j) for j in stored_jobs]
+    return response_items
+
+
+@app.post("/jobs/test-ingest", response_model=JobRead)
+def ingest_test_job(job_data: JobCreate, db: Session = Depends(get_db)):
+    """
+    Ingest a single test job, compute its score, and store it in the database.
+    """
+    return _ingest_jobs(db, [job_data])[0]
+
+
+@app.post("/jobs/ingest/batch")
+def ingest_jobs_batch(payload: JobsBatchCreate, db: Session = Depends(get_db)):
+    """
+    Ingest multiple jobs, compute their scores, and save them to the database,
+    skipping duplicates based on (source, source_id).
+    """
+    response_items = _ingest_jobs(db, payload.jobs)
+
+    # Stream the array item by item so the response never exists as one big
+    # JSON string in memory alongside the stored jobs.
+    def _stream():
+        yield b"["
+        first = True
+        for item in response_items:
+            prefix = b"" if first else b","
+            first = False
+            yield prefix + orjson.dumps(item)
+        yield b"]"
+
+    return StreamingResponse(_stream(), media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -206,24 +323,76 @@ def ingest_jobs_batch(payload: JobsBatchCreate, db: Session = Depends(get_db)):
 # ---------------------------------------------------------------------------
 
 
-@app.get("/jobs", response_model=List[JobRead])
+def _job_to_response(job: Job) -> dict:
+    """
+    Build the JobRead-shaped response dict straight from an ORM row.
+
+    The rows come from our own database, so re-validating every field
+    through Pydantic on the way out is wasted work for list endpoints.
+    """
+    return {
+        "id": job.id,
+        "title": job.title,
+        "company": job.company,
+        "location": job.location,
+        "description": job.description,
+        "url": job.url,
+        "source": job.source,
+        "source_id": job.source_id,
+        "published_at": job.published_at,
+        "match_score": job.match_score,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+    }
+
+
+# Core SELECT over the raw columns: list endpoints only serialize rows, so
+# they skip ORM instance construction and identity-map bookkeeping entirely.
+_JOB_SELECT = select(*Job.__table__.columns)
+
+
+@app.get("/jobs")
 def list_jobs(
     min_score: Optional[float] = Query(default=None, ge=0.0, le=1.0),
+    limit: int = Query(default=100, ge=1, le=1000),
+    after_id: Optional[str] = Query(default=None),
     db: Session = Depends(get_db),
 ):
     """
-    Return all stored jobs, optionally filtered by a minimum match score.
+    Return stored jobs ordered by score, optionally filtered by a minimum
+    match score, paginated with a keyset cursor.
+
+    Pass the X-Next-Cursor response header back as `after_id` to fetch the
+    next page; the mandatory limit keeps query time and memory O(limit).
     """
-    query = db.query(Job)
+    stmt = _JOB_SELECT
 
     if min_score is not None:
-        query = query.filter(Job.match_score >= min_score)
+        stmt = stmt.where(Job.match_score >= min_score)
+
+    if after_id is not None:
+        anchor_score = db.execute(
+            select(Job.match_score).where(Job.id == after_id)
+        ).scalar_one_or_none()
+        if anchor_score is not None:
+            # Seek past the cursor row: strictly lower score, or same score
+            # with a higher id (matching the ORDER BY below).
+            stmt = stmt.where(
+                or_(
+                    Job.match_score < anchor_score,
+                    and_(Job.match_score == anchor_score, Job.id > after_id),
+                )
+            )
+
+    stmt = stmt.order_by(Job.match_score.desc(), Job.id).limit(limit)
+
+    rows = [dict(row) for row in db.execute(stmt).mappings()]
 
-    jobs = query.all()
-    return [JobRead.from_orm(j) for j in jobs]
+    headers = {"X-Next-Cursor": rows[-1]["id"]} if len(rows) == limit else {}
+    return ORJSONResponse(rows, headers=headers)
 
 
-@app.get("/jobs/recommended", response_model=List[JobRead])
+@app.get("/jobs/recommended")
 def list_recommended_jobs(
     min_score: float = Query(default=0.5, ge=0.0, le=1.0),
     limit: int = Query(default=10, ge=1),
@@ -233,15 +402,14 @@ def list_recommended_jobs(
     """
     Return top jobs sorted by score, with optional date filter.
     """
-    query = db.query(Job).filter(Job.match_score >= min_score)
+    stmt = _JOB_SELECT.where(Job.match_score >= min_score)
 
     if since is not None:
-        query = query.filter(Job.published_at >= since)
+        stmt = stmt.where(Job.published_at >= since)
 
-    query = query.order_by(Job.match_score.desc())
+    stmt = stmt.order_by(Job.match_score.desc()).limit(limit)
 
-    jobs = query.limit(limit).all()
-    return [JobRead.from_orm(j) for j in jobs]
+    return [dict(row) for row in db.execute(stmt).mappings()]
 
 
 # ---------------------------------------------------------------------------